@@ -63,6 +63,8 @@ class WhatsAppMessage(Document):
             },
         }
 
+        ref_doc = None
+
         if template.sample_values:
             field_names = template.field_names.split(",") if template.field_names else template.sample_values.split(",")
             parameters = []
@@ -89,7 +91,8 @@ class WhatsAppMessage(Document):
             header_parameters = []
             template_header_parameters = []
 
-            ref_doc = frappe.get_doc(self.reference_doctype, self.reference_name)
+            # reuse the reference document if the body parameters already loaded it
+            ref_doc = ref_doc or frappe.get_doc(self.reference_doctype, self.reference_name)
             for field_name in field_names:
                 value = ref_doc.get_formatted(field_name.strip())
                 
@@ -107,7 +110,7 @@ class WhatsAppMessage(Document):
 
     def notify(self, data):
         """Notify."""
-        settings = frappe.get_doc(
+        settings = frappe.get_cached_doc(
             "WhatsApp Settings",
             "WhatsApp Settings",
         )
@@ -126,13 +129,14 @@ class WhatsAppMessage(Document):
             self.message_id = response["messages"][0]["id"]
 
         except Exception as e:
-            res = frappe.flags.integration_request.json()["error"]
+            meta = frappe.flags.integration_request.json()
+            res = meta["error"]
             error_message = res.get("Error", res.get("message"))
             frappe.get_doc(
                 {
                     "doctype": "WhatsApp Notification Log",
                     "template": "Text Message",
-                    "meta_data": frappe.flags.integration_request.json(),
+                    "meta_data": meta,
                 }
             ).insert(ignore_permissions=True)
 
@@ -140,31 +144,26 @@ class WhatsAppMessage(Document):
 
     def format_number(self, number):
         """Format number."""
-        if number.startswith("+"):
-            number = number[1 : len(number)]
-
-        return number
+        return number.removeprefix("+")
 
 
 
 def on_doctype_update():
     frappe.db.add_index("WhatsApp Message", ["reference_doctype", "reference_name"])
+    frappe.db.add_index("WhatsApp Message", ["message_id"])
 
 
 @frappe.whitelist()
 def send_template(to, reference_doctype, reference_name, template):
-    try:
-        doc = frappe.get_doc({
-            "doctype": "WhatsApp Message",
-            "to": to,
-            "type": "Outgoing",
-            "message_type": "Template",
-            "reference_doctype": reference_doctype,
-            "reference_name": reference_name,
-            "content_type": "text",
-            "template": template
-        })
-
-        doc.save()
-    except Exception as e:
-        raise e
+    doc = frappe.get_doc({
+        "doctype": "WhatsApp Message",
+        "to": to,
+        "type": "Outgoing",
+        "message_type": "Template",
+        "reference_doctype": reference_doctype,
+        "reference_name": reference_name,
+        "content_type": "text",
+        "template": template
+    })
+
+    doc.save()
@@ -7,6 +7,7 @@ from frappe.utils.safe_exec import get_safe_globals, safe_exec
 from frappe.integrations.utils import make_post_request
 from frappe.desk.form.utils import get_pdf_link
 from frappe.utils import add_to_date, nowdate, datetime
+from frappe_whatsapp.utils import clear_notifications_map
 
 
 class WhatsAppNotification(Document):
@@ -15,13 +16,9 @@ class WhatsAppNotification(Document):
     def validate(self):
         """Validate."""
         if self.notification_type == "DocType Event":
-            fields = frappe.get_doc("DocType", self.reference_doctype).fields
-            fields += frappe.get_all(
-                "Custom Field",
-                filters={"dt": self.reference_doctype},
-                fields=["fieldname"]
-            )
-            if not any(field.fieldname == self.field_name for field in fields): # noqa
+            # meta already merges custom fields and indexes them by fieldname
+            meta = frappe.get_meta(self.reference_doctype)
+            if not meta.has_field(self.field_name):
                 frappe.throw(f"Field name {self.field_name} does not exists")
         if self.custom_attachment:
             if not self.attach and not self.attach_from_field:
@@ -32,29 +29,26 @@ class WhatsAppNotification(Document):
         safe_exec(
             self.condition, get_safe_globals(), dict(doc=self)
         )
-        language_code = frappe.db.get_value(
-            "WhatsApp Templates", self.template,
-            fieldname='language_code'
-        )
-        template_actual_name = frappe.db.get_value(
+        template = frappe.db.get_value(
             "WhatsApp Templates", self.template,
-            fieldname='actual_name'
+            ["language_code", "actual_name", "header_type"],
+            as_dict=True
         )
-        if language_code:
+        if template and template.language_code:
             for contact in self._contact_list:
                 data = {
                     "messaging_product": "whatsapp",
                     "to": self.format_number(contact),
                     "type": "template",
                     "template": {
-                        "name": template_actual_name,
+                        "name": template.actual_name,
                         "language": {
-                            "code": language_code
+                            "code": template.language_code
                         },
                         "components": []
                     }
                 }
-                self.content_type = template.get("header_type", "text").lower()
+                self.content_type = (template.header_type or "text").lower()
                 self.notify(data)
         # return _globals.frappe.flags
 
@@ -73,7 +67,8 @@ class WhatsAppNotification(Document):
 
         template = frappe.db.get_value(
             "WhatsApp Templates", self.template,
-            fieldname='*'
+            ["actual_name", "language_code", "header_type"],
+            as_dict=True
         )
 
         if template:
@@ -111,21 +106,8 @@ class WhatsAppNotification(Document):
                 # frappe.db.begin()
                 key = doc.get_document_share_key()  # noqa
                 frappe.db.commit()
-                print_format = "Standard"
-                doctype = frappe.get_doc("DocType", doc_data['doctype'])
-                if doctype.custom:
-                    if doctype.default_print_format:
-                        print_format = doctype.default_print_format
-                else:
-                    default_print_format = frappe.db.get_value(
-                        "Property Setter",
-                        filters={
-                            "doc_type": doc_data['doctype'],
-                            "property": "default_print_format"
-                        },
-                        fieldname="value"
-                    )
-                    print_format = default_print_format if default_print_format else print_format
+                # meta already applies the default_print_format property setter
+                print_format = frappe.get_meta(doc_data['doctype']).default_print_format or "Standard"
                 link = get_pdf_link(
                     doc_data['doctype'],
                     doc_data['name'],
@@ -173,13 +155,13 @@ class WhatsAppNotification(Document):
                         }
                     }]
                 })
-            self.content_type = template.header_type.lower()
+            self.content_type = (template.header_type or "text").lower()
 
             self.notify(data)
 
     def notify(self, data):
         """Notify."""
-        settings = frappe.get_doc(
+        settings = frappe.get_cached_doc(
             "WhatsApp Settings", "WhatsApp Settings",
         )
         token = settings.get_password("token")
@@ -226,24 +208,29 @@ class WhatsAppNotification(Document):
             if not success:
                 meta = {"error": error_message}
             else:
-                meta = frappe.flags.integration_request.json()
+                meta = response
             frappe.get_doc({
                 "doctype": "WhatsApp Notification Log",
                 "template": self.template,
                 "meta_data": meta
             }).insert(ignore_permissions=True)
 
+    def on_update(self):
+        """On update refresh the schedule."""
+        clear_notifications_map()
+
+    def after_rename(self, old, new, merge=False):
+        """On rename drop the old name from the schedule."""
+        clear_notifications_map()
+
     def on_trash(self):
         """On delete remove from schedule."""
-        frappe.cache().delete_value("whatsapp_notification_map")
+        clear_notifications_map()
 
 
     def format_number(self, number):
         """Format number."""
-        if (number.startswith("+")):
-            number = number[1:len(number)]
-
-        return number
+        return number.removeprefix("+")
 
 
     def get_documents_for_today(self):
@@ -1,9 +1,47 @@
 # Copyright (c) 2022, Shridhar Patil and Contributors
 # See license.txt
 
-# import frappe
-from frappe.tests import UnitTestCase
+from unittest.mock import patch
 
+import frappe
+from frappe.tests import IntegrationTestCase
 
-class TestWhatsAppTemplates(UnitTestCase):
-	pass
+from frappe_whatsapp.frappe_whatsapp.doctype.whatsapp_templates.whatsapp_templates import fetch
+
+MODULE = "frappe_whatsapp.frappe_whatsapp.doctype.whatsapp_templates.whatsapp_templates"
+SETTINGS = "frappe_whatsapp.frappe_whatsapp.doctype.whatsapp_settings.whatsapp_settings.WhatsAppSettings"
+
+
+def get_meta_template(language, template_id):
+	"""Template entry as returned by the message_templates endpoint."""
+	return {
+		"name": "test_multi_language",
+		"status": "APPROVED",
+		"language": language,
+		"category": "UTILITY",
+		"id": template_id,
+		"components": [{"type": "BODY", "text": "Hello"}],
+	}
+
+
+class TestWhatsAppTemplates(IntegrationTestCase):
+	def tearDown(self):
+		frappe.db.delete("WhatsApp Templates", {"actual_name": "test_multi_language"})
+		frappe.db.commit()
+
+	def test_fetch_same_name_in_multiple_languages(self):
+		"""A template with several languages is stored once, not inserted twice."""
+		response = {"data": [get_meta_template("en", "1001"), get_meta_template("es", "1002")]}
+
+		with patch(f"{MODULE}.make_request", return_value=response), patch(
+			f"{SETTINGS}.get_password", return_value="token"
+		):
+			fetch()
+
+		templates = frappe.get_all(
+			"WhatsApp Templates",
+			filters={"actual_name": "test_multi_language"},
+			fields=["language_code", "id"],
+		)
+		self.assertEqual(len(templates), 1)
+		self.assertEqual(templates[0].id, "1002")
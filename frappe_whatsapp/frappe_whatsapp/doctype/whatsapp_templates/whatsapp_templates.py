@@ -134,24 +134,16 @@ class WhatsAppTemplates(Document):
             data["components"].append(self.get_header())
         if self.footer:
             data["components"].append({"type": "FOOTER", "text": self.footer})
-        try:
-            # post template to meta for update
-            make_post_request(
-                f"{self._url}/{self._version}/{self.id}",
-                headers=self._headers,
-                data=json.dumps(data),
-            )
-        except Exception as e:
-            raise e
-            # res = frappe.flags.integration_request.json()['error']
-            # frappe.throw(
-            #     msg=res.get('error_user_msg', res.get("message")),
-            #     title=res.get("error_user_title", "Error"),
-            # )
+        # post template to meta for update
+        make_post_request(
+            f"{self._url}/{self._version}/{self.id}",
+            headers=self._headers,
+            data=json.dumps(data),
+        )
 
     def get_settings(self):
         """Get whatsapp settings."""
-        settings = frappe.get_doc("WhatsApp Settings", "WhatsApp Settings")
+        settings = frappe.get_cached_doc("WhatsApp Settings", "WhatsApp Settings")
         self._token = settings.get_password("token")
         self._url = settings.url
         self._version = settings.version
@@ -204,7 +196,7 @@ def fetch():
     """Fetch templates from meta."""
 
     # get credentials
-    settings = frappe.get_doc("WhatsApp Settings", "WhatsApp Settings")
+    settings = frappe.get_cached_doc("WhatsApp Settings", "WhatsApp Settings")
     token = settings.get_password("token")
     url = settings.url
     version = settings.version
@@ -219,11 +211,19 @@ def fetch():
             headers=headers,
         )
 
+        # map actual_name -> name for every fetched template in a single query
+        existing_templates = dict(frappe.get_all(
+            "WhatsApp Templates",
+            filters={"actual_name": ("in", [template["name"] for template in response["data"]])},
+            fields=["actual_name", "name"],
+            as_list=True,
+        ))
+
         for template in response["data"]:
             # set flag to insert or update
             flags = 1
-            if frappe.db.exists("WhatsApp Templates", {"actual_name": template["name"]}):
-                doc = frappe.get_doc("WhatsApp Templates", {"actual_name": template["name"]})
+            if template["name"] in existing_templates:
+                doc = frappe.get_doc("WhatsApp Templates", existing_templates[template["name"]])
             else:
                 flags = 0
                 doc = frappe.new_doc("WhatsApp Templates")
@@ -263,11 +263,17 @@ def fetch():
                 doc.db_update()
             else:
                 doc.db_insert()
-            frappe.db.commit()
+                # meta returns one entry per language under the same name
+                existing_templates[template["name"]] = doc.name
+
+        frappe.db.commit()
 
     except Exception as e:
-        res = frappe.flags.integration_request.json()["error"]
-        error_message = res.get("error_user_msg", res.get("message"))
+        # only a failed Graph API call leaves an error body on the integration request
+        res = {}
+        if frappe.flags.integration_request:
+            res = frappe.flags.integration_request.json().get("error", {})
+        error_message = res.get("error_user_msg", res.get("message", str(e)))
         frappe.throw(
             msg=error_message,
             title=res.get("error_user_title", "Error"),
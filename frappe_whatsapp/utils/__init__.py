@@ -25,7 +25,7 @@ def run_server_script_for_doc_event(doc, event):
     if notification:
         # run all scripts for this doctype + event
         for notification_name in notification:
-            frappe.get_doc(
+            frappe.get_cached_doc(
                 "WhatsApp Notification",
                 notification_name
             ).send_template_message(doc)
@@ -36,6 +36,10 @@ def get_notifications_map():
     if frappe.flags.in_patch and not frappe.db.table_exists("WhatsApp Notification"):
         return {}
 
+    notification_map = frappe.cache().get_value("whatsapp_notification_map")
+    if notification_map is not None:
+        return notification_map
+
     notification_map = {}
     enabled_whatsapp_notifications = frappe.get_all(
         "WhatsApp Notification",
@@ -55,6 +59,11 @@ def get_notifications_map():
     return notification_map
 
 
+def clear_notifications_map():
+    """Drop cached mapping so the next event rebuilds it."""
+    frappe.cache().delete_value("whatsapp_notification_map")
+
+
 def trigger_whatsapp_notifications_all():
     """Run all."""
     trigger_whatsapp_notifications("All")
@@ -2,7 +2,6 @@
 import frappe
 import json
 import requests
-import time
 from werkzeug.wrappers import Response
 import frappe.utils
 
@@ -78,7 +77,7 @@ def post():
 					"content_type": "flow"
 				}).insert(ignore_permissions=True)
 			elif message_type in ["image", "audio", "video", "document"]:
-				settings = frappe.get_doc(
+				settings = frappe.get_cached_doc(
 							"WhatsApp Settings", "WhatsApp Settings",
 						)
 				token = settings.get_password("token")
@@ -90,7 +89,7 @@ def post():
 					'Authorization': 'Bearer ' + token
 
 				}
-				response = requests.get(f'{url}{media_id}/', headers=headers)
+				response = requests.get(f'{url}{media_id}/', headers=headers, timeout=30)
 
 				if response.status_code == 200:
 					media_data = response.json()
@@ -98,7 +97,7 @@ def post():
 					mime_type = media_data.get("mime_type")
 					file_extension = mime_type.split('/')[1]
 
-					media_response = requests.get(media_url, headers=headers)
+					media_response = requests.get(media_url, headers=headers, timeout=30)
 					if media_response.status_code == 200:
 
 						file_data = media_response.content